@@ -242,21 +242,22 @@ class NewVariableConfiguration:
         _cx: list[MX |SX]
             The scaled decision variables
         """
-        _cx = [self.nlp.cx() for _ in range(n_shooting + 1)]
+        # The mapping, the symbol constructor and the name prefixes do not depend on the node,
+        # so resolve them once instead of at every node and column
+        sym = self.nlp.cx.sym
+        name_prefixes = [
+            f"{'-' if np.sign(idx) < 0 else ''}{self.name}_{self.name_elements[abs(idx)]}_phase{self.nlp.phase_idx}_node"
+            for idx in self.nlp.variable_mappings[self.name].to_first.map_idx
+        ]
+
+        _cx = []
         for node_index in range(n_shooting + 1):
-            _cx[node_index] = [self.nlp.cx() for _ in range(n_col)]
-        for idx in self.nlp.variable_mappings[self.name].to_first.map_idx:
-            for node_index in range(n_shooting + 1):
-                for j in range(n_col):
-                    sign = "-" if np.sign(idx) < 0 else ""
-                    _cx[node_index][j] = vertcat(
-                        _cx[node_index][j],
-                        self.nlp.cx.sym(
-                            f"{sign}{self.name}_{self.name_elements[abs(idx)]}_phase{self.nlp.phase_idx}_node{node_index + initial_node}.{j}",
-                            1,
-                            1,
-                        ),
-                    )
+            _cx.append([])
+            for j in range(n_col):
+                # Collect the scalar symbols in a list and concatenate once, instead of growing
+                # the vector with one vertcat per element
+                syms = [sym(f"{prefix}{node_index + initial_node}.{j}", 1, 1) for prefix in name_prefixes]
+                _cx[node_index].append(vertcat(*syms) if syms else self.nlp.cx())
         return _cx
 
     def define_cx_unscaled(self, _cx_scaled: list[MX | SX, ...], scaling: np.ndarray) -> list[MX | SX, ...]:
@@ -279,21 +280,12 @@ class NewVariableConfiguration:
         _cx: list[SX | MX]
             The symbolic unscaled decision variables.
         """
-        _cx = [self.nlp.cx() for _ in range(len(_cx_scaled))]
-        for node_index in range(len(_cx_scaled)):
-            _cx[node_index] = [self.nlp.cx() for _ in range(len(_cx_scaled[0]))]
-
-        for node_index in range(len(_cx_scaled)):
-            for j in range(len(_cx_scaled[0])):
-                _cx[node_index][j] = _cx_scaled[node_index][j] * scaling
-        return _cx
+        return [[cx_scaled_col * scaling for cx_scaled_col in node_columns] for node_columns in _cx_scaled]
 
     def _declare_auto_variable_mapping(self):
         """Declare the mapping of the new variable if not already declared"""
         if self.name not in self.nlp.variable_mappings:
-            self.nlp.variable_mappings[self.name] = BiMapping(
-                range(len(self.name_elements)), range(len(self.name_elements))
-            )
+            self.nlp.variable_mappings[self.name] = BiMapping.identity(len(self.name_elements))
 
     def _declare_initial_guess(self):
         if self.as_states and self.name not in self.nlp.x_init:
@@ -331,53 +323,37 @@ class NewVariableConfiguration:
     def _use_copy(self):
         """Use of states[0] and controls[0] is permitted since nlp.phase_dynamics
         is PhaseDynamics.SHARED_DURING_THE_PHASE"""
+        # todo: if mapping on variables, what do we do with mapping on the nodes
+        # A single batched vector symbol avoids growing the graph one scalar at a time with vertcat
+        n_sym = len(self.nlp.variable_mappings[self.name].to_second.map_idx)
+
         self.mx_states = (
-            [] if not self.copy_states else [self.ocp.nlp[self.nlp.use_states_from_phase_idx].states[0][self.name].mx]
+            self.ocp.nlp[self.nlp.use_states_from_phase_idx].states[0][self.name].mx
+            if self.copy_states
+            else MX.sym(f"{self.name}_MX", n_sym, 1)
         )
         self.mx_states_dot = (
-            []
-            if not self.copy_states_dot
-            else [self.ocp.nlp[self.nlp.use_states_dot_from_phase_idx].states_dot[0][self.name].mx]
+            self.ocp.nlp[self.nlp.use_states_dot_from_phase_idx].states_dot[0][self.name].mx
+            if self.copy_states_dot
+            else MX.sym(f"{self.name}_MX", n_sym, 1)
         )
         self.mx_controls = (
-            []
-            if not self.copy_controls
-            else [self.ocp.nlp[self.nlp.use_controls_from_phase_idx].controls[0][self.name].mx]
-        )
-        self.mx_algebraic_states = (
-            []
-            if not self.copy_algebraic_states
-            else [self.ocp.nlp[self.nlp.use_states_from_phase_idx].algebraic_states[0][self.name].mx]
+            self.ocp.nlp[self.nlp.use_controls_from_phase_idx].controls[0][self.name].mx
+            if self.copy_controls
+            else MX.sym(f"{self.name}_MX", n_sym, 1)
         )
-
-        # todo: if mapping on variables, what do we do with mapping on the nodes
-        for i in self.nlp.variable_mappings[self.name].to_second.map_idx:
-            var_name = (
-                f"{'-' if np.sign(i) < 0 else ''}{self.name}_{self.name_elements[abs(i)]}_MX"
-                if i is not None
-                else "zero"
+        # The algebraic states always get fresh symbols, stacked below the copied ones if any
+        self.mx_algebraic_states = MX.sym(f"{self.name}_MX", n_sym, 1)
+        if self.copy_algebraic_states:
+            self.mx_algebraic_states = vertcat(
+                self.ocp.nlp[self.nlp.use_states_from_phase_idx].algebraic_states[0][self.name].mx,
+                self.mx_algebraic_states,
             )
 
-            if not self.copy_states:
-                self.mx_states.append(MX.sym(var_name, 1, 1))
-
-            if not self.copy_states_dot:
-                self.mx_states_dot.append(MX.sym(var_name, 1, 1))
-
-            if not self.copy_controls:
-                self.mx_controls.append(MX.sym(var_name, 1, 1))
-
-            self.mx_algebraic_states.append(MX.sym(var_name, 1, 1))
-
-        self.mx_states = vertcat(*self.mx_states)
-        self.mx_states_dot = vertcat(*self.mx_states_dot)
-        self.mx_controls = vertcat(*self.mx_controls)
-        self.mx_algebraic_states = vertcat(*self.mx_algebraic_states)
-
     def _declare_auto_axes_idx(self):
         """Declare the axes index if not already declared"""
         if not self.axes_idx:
-            self.axes_idx = BiMapping(to_first=range(len(self.name_elements)), to_second=range(len(self.name_elements)))
+            self.axes_idx = BiMapping.identity(len(self.name_elements))
 
     def _declare_legend(self):
         """Declare the legend if not already declared"""
@@ -417,8 +393,11 @@ class NewVariableConfiguration:
                     node_index,
                 )
                 if not self.skip_plot:
+                    # The key index is resolved once here, as a numpy index array, so the plot
+                    # callback does not redo the dict lookup at every frame
+                    states_key_index = np.asarray(self.nlp.states.key_index(self.name), dtype=np.int64)
                     self.nlp.plot[f"{self.name}_states"] = CustomPlot(
-                        lambda t0, phases_dt, node_idx, x, u, p, a: x[self.nlp.states.key_index(self.name), :]
+                        lambda t0, phases_dt, node_idx, x, u, p, a, key_index=states_key_index: x[key_index, :]
                         if x.any()
                         else np.ndarray((cx[0][0].shape[0], 1)) * np.nan,
                         plot_type=PlotType.INTEGRATED,
@@ -452,8 +431,9 @@ class NewVariableConfiguration:
 
                 plot_type = PlotType.PLOT if self.nlp.control_type == ControlType.LINEAR_CONTINUOUS else PlotType.STEP
                 if not self.skip_plot:
+                    controls_key_index = np.asarray(self.nlp.controls.key_index(self.name), dtype=np.int64)
                     self.nlp.plot[f"{self.name}_controls"] = CustomPlot(
-                        lambda t0, phases_dt, node_idx, x, u, p, a: u[self.nlp.controls.key_index(self.name), :]
+                        lambda t0, phases_dt, node_idx, x, u, p, a, key_index=controls_key_index: u[key_index, :]
                         if u.any()
                         else np.ndarray((cx[0][0].shape[0], 1)) * np.nan,
                         plot_type=plot_type,
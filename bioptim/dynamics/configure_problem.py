@@ -1,6 +1,10 @@
+from enum import Enum
+import hashlib
+import os
+from pathlib import Path
 from typing import Callable, Any
 
-from casadi import vertcat, Function, DM, MX
+from casadi import vertcat, cse, Function, DM, MX, CasadiMeta
 
 from .configure_new_variable import NewVariableConfiguration
 from .dynamics_functions import DynamicsFunctions
@@ -97,23 +101,25 @@ class ConfigureProblem:
 
         idx = nlp.phase_mapping.to_first.map_idx if nlp.phase_mapping else range(nlp.model.nb_q)
 
+        name_dof = nlp.model.name_dof
         if nlp.model.nb_quaternions == 0:
-            new_names = [nlp.model.name_dof[i] for i in idx]
+            new_names = [name_dof[i] for i in idx]
         else:
             new_names = []
             for i in nlp.phase_mapping.to_first.map_idx:
-                if nlp.model.name_dof[i][-4:-1] == "Rot" or nlp.model.name_dof[i][-6:-1] == "Trans":
-                    new_names += [nlp.model.name_dof[i]]
+                name = name_dof[i]
+                if name[-4:-1] == "Rot" or name[-6:-1] == "Trans":
+                    new_names += [name]
                 else:
-                    if nlp.model.name_dof[i][-5:] != "QuatW":
+                    if name[-5:] != "QuatW":
                         if var_type == "qdot":
-                            new_names += [nlp.model.name_dof[i][:-5] + "omega" + nlp.model.name_dof[i][-1]]
+                            new_names += [name[:-5] + "omega" + name[-1]]
                         elif var_type == "qddot":
-                            new_names += [nlp.model.name_dof[i][:-5] + "omegadot" + nlp.model.name_dof[i][-1]]
+                            new_names += [name[:-5] + "omegadot" + name[-1]]
                         elif var_type == "qdddot":
-                            new_names += [nlp.model.name_dof[i][:-5] + "omegaddot" + nlp.model.name_dof[i][-1]]
+                            new_names += [name[:-5] + "omegaddot" + name[-1]]
                         elif var_type == "tau" or var_type == "taudot":
-                            new_names += [nlp.model.name_dof[i]]
+                            new_names += [name]
 
         return new_names
 
@@ -266,21 +272,18 @@ class ConfigureProblem:
             ConfigureProblem.configure_soft_contact_forces(ocp, nlp, False, True)
 
         # Configure the actual ODE of the dynamics
-        if nlp.dynamics_type.dynamic_function:
-            ConfigureProblem.configure_dynamics_function(ocp, nlp, DynamicsFunctions.custom)
-        else:
-            ConfigureProblem.configure_dynamics_function(
-                ocp,
-                nlp,
-                DynamicsFunctions.torque_driven,
-                with_contact=with_contact,
-                fatigue=fatigue,
-                rigidbody_dynamics=rigidbody_dynamics,
-                with_passive_torque=with_passive_torque,
-                with_ligament=with_ligament,
-                with_friction=with_friction,
-                external_forces=external_forces,
-            )
+        ConfigureProblem._configure_builtin_or_custom_dynamics(
+            ocp,
+            nlp,
+            DynamicsFunctions.torque_driven,
+            with_contact=with_contact,
+            fatigue=fatigue,
+            rigidbody_dynamics=rigidbody_dynamics,
+            with_passive_torque=with_passive_torque,
+            with_ligament=with_ligament,
+            with_friction=with_friction,
+            external_forces=external_forces,
+        )
 
         # Configure the contact forces
         if with_contact:
@@ -438,19 +441,16 @@ class ConfigureProblem:
         if soft_contacts_dynamics == SoftContactDynamics.CONSTRAINT:
             ConfigureProblem.configure_soft_contact_forces(ocp, nlp, False, True)
 
-        if nlp.dynamics_type.dynamic_function:
-            ConfigureProblem.configure_dynamics_function(ocp, nlp, DynamicsFunctions.custom)
-        else:
-            ConfigureProblem.configure_dynamics_function(
-                ocp,
-                nlp,
-                DynamicsFunctions.torque_derivative_driven,
-                with_contact=with_contact,
-                rigidbody_dynamics=rigidbody_dynamics,
-                with_passive_torque=with_passive_torque,
-                with_ligament=with_ligament,
-                external_forces=external_forces,
-            )
+        ConfigureProblem._configure_builtin_or_custom_dynamics(
+            ocp,
+            nlp,
+            DynamicsFunctions.torque_derivative_driven,
+            with_contact=with_contact,
+            rigidbody_dynamics=rigidbody_dynamics,
+            with_passive_torque=with_passive_torque,
+            with_ligament=with_ligament,
+            external_forces=external_forces,
+        )
 
         if with_contact:
             ConfigureProblem.configure_contact_function(
@@ -514,19 +514,16 @@ class ConfigureProblem:
         if with_residual_torque:
             ConfigureProblem.configure_residual_tau(ocp, nlp, False, True)
 
-        if nlp.dynamics_type.dynamic_function:
-            ConfigureProblem.configure_dynamics_function(ocp, nlp, DynamicsFunctions.custom)
-        else:
-            ConfigureProblem.configure_dynamics_function(
-                ocp,
-                nlp,
-                DynamicsFunctions.torque_activations_driven,
-                with_contact=with_contact,
-                with_passive_torque=with_passive_torque,
-                with_residual_torque=with_residual_torque,
-                with_ligament=with_ligament,
-                external_forces=external_forces,
-            )
+        ConfigureProblem._configure_builtin_or_custom_dynamics(
+            ocp,
+            nlp,
+            DynamicsFunctions.torque_activations_driven,
+            with_contact=with_contact,
+            with_passive_torque=with_passive_torque,
+            with_residual_torque=with_residual_torque,
+            with_ligament=with_ligament,
+            external_forces=external_forces,
+        )
 
         if with_contact:
             ConfigureProblem.configure_contact_function(
@@ -656,21 +653,18 @@ class ConfigureProblem:
                 with_ligament=with_ligament,
             )
 
-        if nlp.dynamics_type.dynamic_function:
-            ConfigureProblem.configure_dynamics_function(ocp, nlp, DynamicsFunctions.custom)
-        else:
-            ConfigureProblem.configure_dynamics_function(
-                ocp,
-                nlp,
-                DynamicsFunctions.muscles_driven,
-                with_contact=with_contact,
-                fatigue=fatigue,
-                with_residual_torque=with_residual_torque,
-                with_passive_torque=with_passive_torque,
-                with_ligament=with_ligament,
-                rigidbody_dynamics=rigidbody_dynamics,
-                external_forces=external_forces,
-            )
+        ConfigureProblem._configure_builtin_or_custom_dynamics(
+            ocp,
+            nlp,
+            DynamicsFunctions.muscles_driven,
+            with_contact=with_contact,
+            fatigue=fatigue,
+            with_residual_torque=with_residual_torque,
+            with_passive_torque=with_passive_torque,
+            with_ligament=with_ligament,
+            rigidbody_dynamics=rigidbody_dynamics,
+            external_forces=external_forces,
+        )
 
         if with_contact:
             ConfigureProblem.configure_contact_function(
@@ -692,7 +686,8 @@ class ConfigureProblem:
         """
 
         name = "q_u"
-        names_u = [nlp.model.name_dof[i] for i in nlp.variable_mappings["q"].to_first.map_idx]
+        name_dof = nlp.model.name_dof
+        names_u = [name_dof[i] for i in nlp.variable_mappings["q"].to_first.map_idx]
         axes_idx = ConfigureProblem._apply_phase_mapping(ocp, nlp, name)
         ConfigureProblem.configure_new_variable(name, names_u, ocp, nlp, True, False, False, axes_idx=axes_idx)
 
@@ -705,6 +700,27 @@ class ConfigureProblem:
         ConfigureProblem.configure_tau(ocp, nlp, as_states=False, as_controls=True)
         ConfigureProblem.configure_dynamics_function(ocp, nlp, DynamicsFunctions.holonomic_torque_driven)
 
+    @staticmethod
+    def _configure_builtin_or_custom_dynamics(ocp, nlp, dyn_func, **extra_params):
+        """
+        Configure the dynamics of the system using the requested builtin function, unless the user
+        provided their own dynamic_function in which case it takes precedence
+
+        Parameters
+        ----------
+        ocp: OptimalControlProgram
+            A reference to the ocp
+        nlp: NonLinearProgram
+            A reference to the phase
+        dyn_func: Callable[time, states, controls, param, algebraic_states]
+            The builtin function to get the derivative of the states
+        """
+
+        if nlp.dynamics_type.dynamic_function:
+            ConfigureProblem.configure_dynamics_function(ocp, nlp, DynamicsFunctions.custom)
+        else:
+            ConfigureProblem.configure_dynamics_function(ocp, nlp, dyn_func, **extra_params)
+
     @staticmethod
     def configure_dynamics_function(ocp, nlp, dyn_func, allow_free_variables: bool = False, **extra_params):
         """
@@ -729,7 +745,44 @@ class ConfigureProblem:
         if not isinstance(dyn_func, (tuple, list)):
             dyn_func = (dyn_func,)
 
+        dynamics_func_cache = getattr(ocp, "_dynamics_func_cache", None)
+        if dynamics_func_cache is None:
+            dynamics_func_cache = ocp._dynamics_func_cache = {}
+
+        # The input symbols are identical for every dynamics function of the phase, so they are
+        # built once here instead of once per function
+        dynamics_inputs = ConfigureProblem._dynamics_function_inputs(nlp)
+
         for func in dyn_func:
+            cache_key = ConfigureProblem._dynamics_cache_key(
+                nlp, func, allow_free_variables=allow_free_variables, **extra_params
+            )
+            if cache_key in dynamics_func_cache:
+                cached_dynamics, cached_implicit = dynamics_func_cache[cache_key]
+                nlp.dynamics_func.append(cached_dynamics)
+                if cached_implicit is not None:
+                    nlp.implicit_dynamics_func.append(cached_implicit)
+                continue
+
+            disk_cache_path = ConfigureProblem._dynamics_disk_cache_path(
+                nlp, func, allow_free_variables=allow_free_variables, **extra_params
+            )
+            if disk_cache_path is not None and disk_cache_path.exists():
+                try:
+                    dynamics = Function.load(str(disk_cache_path))
+                    defects_path = disk_cache_path.with_suffix(".defects.casadi")
+                    implicit = Function.load(str(defects_path)) if defects_path.exists() else None
+                except RuntimeError:
+                    # A corrupted or incompatible entry is simply rebuilt below
+                    pass
+                else:
+                    nlp.dynamics_func.append(dynamics)
+                    if implicit is not None:
+                        nlp.implicit_dynamics_func.append(implicit)
+                    if cache_key is not None:
+                        dynamics_func_cache[cache_key] = (dynamics, implicit)
+                    continue
+
             dynamics_eval = func(
                 nlp.time_mx,
                 nlp.states.scaled.mx_reduced,
@@ -742,18 +795,14 @@ class ConfigureProblem:
             dynamics_dxdt = dynamics_eval.dxdt
             if isinstance(dynamics_dxdt, (list, tuple)):
                 dynamics_dxdt = vertcat(*dynamics_dxdt)
+            # Deduplicating common subexpressions shrinks the graph before it is expanded, which
+            # directly reduces the cost of the Jacobians computed from it
+            dynamics_dxdt = cse(dynamics_dxdt)
 
-            time_span_sym = vertcat(nlp.time_mx, nlp.dt_mx)
             nlp.dynamics_func.append(
                 Function(
                     "ForwardDyn",
-                    [
-                        time_span_sym,
-                        nlp.states.scaled.mx_reduced,
-                        nlp.controls.scaled.mx_reduced,
-                        nlp.parameters.mx,
-                        nlp.algebraic_states.scaled.mx,
-                    ],
+                    dynamics_inputs,
                     [dynamics_dxdt],
                     ["t_span", "x", "u", "p", "a"],
                     ["xdot"],
@@ -766,7 +815,7 @@ class ConfigureProblem:
                 try:
                     nlp.dynamics_func[-1] = nlp.dynamics_func[-1].expand()
                 except Exception as me:
-                    RuntimeError(
+                    raise RuntimeError(
                         f"An error occurred while executing the 'expand()' function for the dynamic function. "
                         f"Please review the following casadi error message for more details.\n"
                         "Several factors could be causing this issue. One of the most likely is the inability to "
@@ -779,15 +828,8 @@ class ConfigureProblem:
                 nlp.implicit_dynamics_func.append(
                     Function(
                         "DynamicsDefects",
-                        [
-                            time_span_sym,
-                            nlp.states.scaled.mx_reduced,
-                            nlp.controls.scaled.mx_reduced,
-                            nlp.parameters.mx,
-                            nlp.algebraic_states.scaled.mx,
-                            nlp.states_dot.scaled.mx_reduced,
-                        ],
-                        [dynamics_eval.defects],
+                        dynamics_inputs + [nlp.states_dot.scaled.mx_reduced],
+                        [cse(dynamics_eval.defects)],
                         ["t_span", "x", "u", "p", "a", "xdot"],
                         ["defects"],
                         {"allow_free": allow_free_variables},
@@ -797,7 +839,7 @@ class ConfigureProblem:
                     try:
                         nlp.implicit_dynamics_func[-1] = nlp.implicit_dynamics_func[-1].expand()
                     except Exception as me:
-                        RuntimeError(
+                        raise RuntimeError(
                             f"An error occurred while executing the 'expand()' function for the dynamic function. "
                             f"Please review the following casadi error message for more details.\n"
                             "Several factors could be causing this issue. One of the most likely is the inability to "
@@ -806,6 +848,163 @@ class ConfigureProblem:
                             f"{me}"
                         )
 
+            if cache_key is not None:
+                dynamics_func_cache[cache_key] = (
+                    nlp.dynamics_func[-1],
+                    nlp.implicit_dynamics_func[-1] if dynamics_eval.defects is not None else None,
+                )
+
+            if disk_cache_path is not None:
+                try:
+                    disk_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    nlp.dynamics_func[-1].save(str(disk_cache_path))
+                    if dynamics_eval.defects is not None:
+                        nlp.implicit_dynamics_func[-1].save(str(disk_cache_path.with_suffix(".defects.casadi")))
+                except (OSError, RuntimeError):
+                    # Failing to populate the cache must not fail the configuration
+                    pass
+
+    @staticmethod
+    def _dynamics_function_inputs(nlp) -> list[MX]:
+        """
+        The symbolic inputs shared by the dynamics and contact forces Functions of a phase
+
+        Parameters
+        ----------
+        nlp: NonLinearProgram
+            A reference to the phase
+
+        Returns
+        -------
+        The time span, states, controls, parameters and algebraic states symbols, in Function order
+        """
+
+        return [
+            vertcat(nlp.time_mx, nlp.dt_mx),
+            nlp.states.scaled.mx_reduced,
+            nlp.controls.scaled.mx_reduced,
+            nlp.parameters.mx,
+            nlp.algebraic_states.scaled.mx,
+        ]
+
+    @staticmethod
+    def _dynamics_cache_key(nlp, func: Callable, allow_free_variables: bool, **extra_params) -> tuple | None:
+        """
+        Build a hashable key identifying the dynamics Function of a phase, so phases sharing the same
+        dynamics signature (same function, model, variable sizes, mappings and parameters) reuse the
+        Function built for a previous phase instead of re-tracing and re-expanding it.
+
+        Parameters
+        ----------
+        nlp: NonLinearProgram
+            A reference to the phase
+        func: Callable
+            The function to get the derivative of the states
+        allow_free_variables: bool
+            If the dynamics depends on free variables. Such a Function closes over phase-specific
+            symbols, so it can never be shared across phases
+
+        Returns
+        -------
+        The key, or None if the dynamics cannot safely be cached
+        """
+
+        if allow_free_variables:
+            return None
+        extra_key = tuple(sorted(extra_params.items()))
+        try:
+            hash(extra_key)
+        except TypeError:
+            # At least one parameter is unhashable (e.g. external_forces), the graph cannot be compared
+            return None
+        # The mappings change which rows of the reduced symbols reach the model, so phases with
+        # identical shapes but different mappings must not share a Function
+        mappings_key = tuple(
+            (
+                name,
+                tuple(mapping.to_first.map_idx),
+                tuple(mapping.to_first.oppose),
+                tuple(mapping.to_second.map_idx),
+                tuple(mapping.to_second.oppose),
+            )
+            for name, mapping in sorted(nlp.variable_mappings.items())
+        )
+        return (
+            func,
+            nlp.model,
+            nlp.dynamics_type.dynamic_function,
+            nlp.dynamics_type.expand_dynamics,
+            nlp.states.scaled.mx_reduced.shape,
+            nlp.controls.scaled.mx_reduced.shape,
+            nlp.parameters.mx.shape,
+            nlp.algebraic_states.scaled.mx.shape,
+            mappings_key,
+            extra_key,
+        )
+
+    @staticmethod
+    def _dynamics_disk_cache_path(nlp, func: Callable, allow_free_variables: bool, **extra_params) -> Path | None:
+        """
+        Build the path of the on-disk cache entry for the dynamics Function of a phase, so successive
+        runs of the same script skip the tracing and expansion entirely. The cache is opt-in: it is
+        only active when the BIOPTIM_CACHE_DIR environment variable points to a directory, and only
+        for the built-in dynamics (a user-defined dynamic_function can change between runs without
+        anything in the key noticing).
+
+        Parameters
+        ----------
+        nlp: NonLinearProgram
+            A reference to the phase
+        func: Callable
+            The function to get the derivative of the states
+        allow_free_variables: bool
+            If the dynamics depends on free variables. Such a Function cannot be serialized
+
+        Returns
+        -------
+        The path of the cache entry, or None if the dynamics cannot safely be cached on disk
+        """
+
+        cache_dir = os.environ.get("BIOPTIM_CACHE_DIR")
+        if not cache_dir or allow_free_variables or nlp.dynamics_type.dynamic_function is not None:
+            return None
+        # Only simple flag-like parameters have a repr that identifies their value across runs;
+        # anything else (numpy arrays, fatigue models, ...) cannot safely name a disk entry
+        if any(value is not None and not isinstance(value, (bool, Enum)) for value in extra_params.values()):
+            return None
+
+        try:
+            model_paths = nlp.model.path
+        except AttributeError:
+            return None
+        if isinstance(model_paths, str):
+            model_paths = (model_paths,)
+        else:
+            # MultiBiorbdModel returns a pair of path lists
+            model_paths = tuple(path for path_group in model_paths for path in path_group)
+
+        digest = hashlib.sha1()
+        digest.update(CasadiMeta.version().encode())
+        digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+        digest.update(repr(sorted((key, repr(value)) for key, value in extra_params.items())).encode())
+        digest.update(
+            repr(
+                (
+                    nlp.dynamics_type.expand_dynamics,
+                    nlp.states.scaled.mx_reduced.shape,
+                    nlp.controls.scaled.mx_reduced.shape,
+                    nlp.parameters.mx.shape,
+                    nlp.algebraic_states.scaled.mx.shape,
+                )
+            ).encode()
+        )
+        for path in model_paths:
+            try:
+                digest.update(Path(path).read_bytes())
+            except OSError:
+                return None
+        return Path(cache_dir) / f"{digest.hexdigest()}.casadi"
+
     @staticmethod
     def configure_contact_function(ocp, nlp, dyn_func: Callable, **extra_params):
         """
@@ -821,51 +1020,68 @@ class ConfigureProblem:
             The function to get the values of contact forces from the dynamics
         """
 
-        time_span_sym = vertcat(nlp.time_mx, nlp.dt_mx)
-        nlp.contact_forces_func = Function(
-            "contact_forces_func",
-            [
-                time_span_sym,
-                nlp.states.scaled.mx_reduced,
-                nlp.controls.scaled.mx_reduced,
-                nlp.parameters.mx,
-                nlp.algebraic_states.scaled.mx,
-            ],
-            [
-                dyn_func(
-                    time_span_sym,
-                    nlp.states.scaled.mx_reduced,
-                    nlp.controls.scaled.mx_reduced,
-                    nlp.parameters.mx,
-                    nlp.algebraic_states.scaled.mx,
-                    nlp,
-                    **extra_params,
-                )
-            ],
-            ["t_span", "x", "u", "p", "a"],
-            ["contact_forces"],
-        ).expand()
-
-        all_contact_names = []
-        for elt in ocp.nlp:
-            all_contact_names.extend([name for name in elt.model.contact_names if name not in all_contact_names])
+        contact_forces_func_cache = getattr(ocp, "_contact_forces_func_cache", None)
+        if contact_forces_func_cache is None:
+            contact_forces_func_cache = ocp._contact_forces_func_cache = {}
+        cache_key = ConfigureProblem._dynamics_cache_key(nlp, dyn_func, allow_free_variables=False, **extra_params)
 
+        if cache_key in contact_forces_func_cache:
+            nlp.contact_forces_func = contact_forces_func_cache[cache_key]
+        else:
+            contact_inputs = ConfigureProblem._dynamics_function_inputs(nlp)
+            nlp.contact_forces_func = Function(
+                "contact_forces_func",
+                contact_inputs,
+                [cse(dyn_func(*contact_inputs, nlp, **extra_params))],
+                ["t_span", "x", "u", "p", "a"],
+                ["contact_forces"],
+            )
+            if nlp.dynamics_type.expand_dynamics:
+                try:
+                    nlp.contact_forces_func = nlp.contact_forces_func.expand()
+                except Exception as me:
+                    raise RuntimeError(
+                        f"An error occurred while executing the 'expand()' function for the contact forces function. "
+                        f"Please review the following casadi error message for more details.\n"
+                        "Several factors could be causing this issue. One of the most likely is the inability to "
+                        "use expand=True at all. In that case, try adding expand=False to the dynamics.\n"
+                        "Original casadi error message:\n"
+                        f"{me}"
+                    )
+            if cache_key is not None:
+                contact_forces_func_cache[cache_key] = nlp.contact_forces_func
+
+        # The union of the contact names over the phases only depends on the models, so it is
+        # computed once for the whole ocp instead of once per contact-enabled phase
+        models_key = tuple(id(elt.model) for elt in ocp.nlp)
+        cached_names = getattr(ocp, "_all_contact_names", None)
+        if cached_names is not None and cached_names[0] == models_key:
+            all_contact_names = cached_names[1]
+        else:
+            all_contact_names = []
+            seen_contact_names = set()
+            for elt in ocp.nlp:
+                for name in elt.model.contact_names:
+                    if name not in seen_contact_names:
+                        seen_contact_names.add(name)
+                        all_contact_names.append(name)
+            ocp._all_contact_names = (models_key, all_contact_names)
+
+        contact_names_in_phase = set(nlp.model.contact_names)
         if "contact_forces" in nlp.plot_mapping:
-            contact_names_in_phase = [name for name in nlp.model.contact_names]
             axes_idx = BiMapping(
                 to_first=nlp.plot_mapping["contact_forces"].map_idx,
                 to_second=[i for i, c in enumerate(all_contact_names) if c in contact_names_in_phase],
             )
         else:
-            contact_names_in_phase = [name for name in nlp.model.contact_names]
             axes_idx = BiMapping(
                 to_first=[i for i, c in enumerate(all_contact_names) if c in contact_names_in_phase],
                 to_second=[i for i, c in enumerate(all_contact_names) if c in contact_names_in_phase],
             )
 
         nlp.plot["contact_forces"] = CustomPlot(
-            lambda t0, phases_dt, node_idx, x, u, p, a: nlp.contact_forces_func(
-                [t0, t0 + phases_dt[nlp.phase_idx]], x, u, p, a
+            lambda t0, phases_dt, node_idx, x, u, p, a, contact_forces_func=nlp.contact_forces_func, phase_idx=nlp.phase_idx: contact_forces_func(
+                [t0, t0 + phases_dt[phase_idx]], x, u, p, a
             ),
             plot_type=PlotType.INTEGRATED,
             axes_idx=axes_idx,
@@ -896,7 +1112,25 @@ class ConfigureProblem:
             [global_soft_contact_force_func],
             ["t", "x", "u", "p"],
             ["soft_contact_forces"],
-        ).expand()
+        )
+        if nlp.dynamics_type.expand_dynamics:
+            try:
+                nlp.soft_contact_forces_func = nlp.soft_contact_forces_func.expand()
+            except Exception as me:
+                raise RuntimeError(
+                    f"An error occurred while executing the 'expand()' function for the soft contact forces function. "
+                    f"Please review the following casadi error message for more details.\n"
+                    "Several factors could be causing this issue. One of the most likely is the inability to "
+                    "use expand=True at all. In that case, try adding expand=False to the dynamics.\n"
+                    "Original casadi error message:\n"
+                    f"{me}"
+                )
+
+        def soft_contact_plot(sc_slice, forces_func=nlp.soft_contact_forces_func, phase_idx=nlp.phase_idx):
+            # The function and phase index are bound now, so the plot does not hold the whole nlp alive
+            return lambda t0, phases_dt, node_idx, x, u, p, a: forces_func([t0, t0 + phases_dt[phase_idx]], x, u, p, a)[
+                sc_slice, :
+            ]
 
         for i_sc in range(nlp.model.nb_soft_contacts):
             all_soft_contact_names = []
@@ -929,9 +1163,7 @@ class ConfigureProblem:
                     to_second=[i for i, c in enumerate(all_soft_contact_names) if c in soft_contact_names_in_phase],
                 )
             nlp.plot[f"soft_contact_forces_{nlp.model.soft_contact_names[i_sc]}"] = CustomPlot(
-                lambda t0, phases_dt, node_idx, x, u, p, a: nlp.soft_contact_forces_func(
-                    [t0, t0 + phases_dt[nlp.phase_idx]], x, u, p, a
-                )[(i_sc * 6) : ((i_sc + 1) * 6), :],
+                soft_contact_plot(slice(i_sc * 6, (i_sc + 1) * 6)),
                 plot_type=PlotType.INTEGRATED,
                 axes_idx=phase_mappings,
                 legend=all_soft_contact_names,
@@ -1230,7 +1462,7 @@ class ConfigureProblem:
         for name_1 in [f"X_{i}" for i in range(n_noised_states)]:
             for name_2 in [f"X_{i}" for i in range(n_noised_states)]:
                 name_a += [name_1 + "_&_" + name_2]
-        nlp.variable_mappings[name] = BiMapping(list(range(n_noised_states**2)), list(range(n_noised_states**2)))
+        nlp.variable_mappings[name] = BiMapping.identity(n_noised_states**2)
 
         ConfigureProblem.configure_new_variable(
             name,
@@ -1262,7 +1494,7 @@ class ConfigureProblem:
         for name_1 in [f"X_{i}" for i in range(n_noised_states)]:
             for name_2 in [f"X_{i}" for i in range(n_noised_states)]:
                 name_cov += [name_1 + "_&_" + name_2]
-        nlp.variable_mappings[name] = BiMapping(list(range(n_noised_states**2)), list(range(n_noised_states**2)))
+        nlp.variable_mappings[name] = BiMapping.identity(n_noised_states**2)
         ConfigureProblem.configure_integrated_value(
             name,
             name_cov,
@@ -1289,7 +1521,7 @@ class ConfigureProblem:
         for name_1 in [f"X_{i}" for i in range(n_noised_states)]:
             for name_2 in [f"X_{i}" for i in range(n_noised_states)]:
                 name_cov += [name_1 + "_&_" + name_2]
-        nlp.variable_mappings[name] = BiMapping(list(range(n_noised_states**2)), list(range(n_noised_states**2)))
+        nlp.variable_mappings[name] = BiMapping.identity(n_noised_states**2)
         ConfigureProblem.configure_new_variable(
             name,
             name_cov,
@@ -1321,7 +1553,7 @@ class ConfigureProblem:
         for nb_1, name_1 in enumerate([f"X_{i}" for i in range(n_noised_states)]):
             for name_2 in [f"X_{i}" for i in range(nb_1 + 1)]:
                 name_cov += [name_1 + "_&_" + name_2]
-        nlp.variable_mappings[name] = BiMapping(list(range(len(name_cov))), list(range(len(name_cov))))
+        nlp.variable_mappings[name] = BiMapping.identity(len(name_cov))
         ConfigureProblem.configure_new_variable(
             name,
             name_cov,
@@ -1350,7 +1582,7 @@ class ConfigureProblem:
             raise NotImplementedError(f"Algebraic states and mapping cannot be use together for now.")
 
         name_ref = [f"reference_{i}" for i in range(n_references)]
-        nlp.variable_mappings[name] = BiMapping(list(range(n_references)), list(range(n_references)))
+        nlp.variable_mappings[name] = BiMapping.identity(n_references)
         ConfigureProblem.configure_new_variable(
             name,
             name_ref,
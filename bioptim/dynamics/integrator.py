@@ -299,8 +299,9 @@ class RK(Integrator):
         x[:, 0] = states
         a = algebraic_states
 
+        integration_time = self._integration_time
         for i in range(1, self._n_step + 1):
-            t = self.t_span_sym[0] + self._integration_time * (i - 1)
+            t = self.t_span_sym[0] + integration_time * (i - 1)
             x[:, i] = self.next_x(t, x[:, i - 1], u, p, a)
             if self.model.nb_quaternions > 0:
                 x[:, i] = self.model.normalize_state_quaternions(x[:, i])
@@ -338,9 +339,10 @@ class RK4(RK):
         h = self.h
         t = vertcat(t0, h)
 
+        u_mid = self.get_u(u, t0 + h / 2)
         k1 = self.fun(t, x_prev, self.get_u(u, t0), p, a)[:, self.ode_idx]
-        k2 = self.fun(t, x_prev + h / 2 * k1, self.get_u(u, t0 + h / 2), p, a)[:, self.ode_idx]
-        k3 = self.fun(t, x_prev + h / 2 * k2, self.get_u(u, t0 + h / 2), p, a)[:, self.ode_idx]
+        k2 = self.fun(t, x_prev + h / 2 * k1, u_mid, p, a)[:, self.ode_idx]
+        k3 = self.fun(t, x_prev + h / 2 * k2, u_mid, p, a)[:, self.ode_idx]
         k4 = self.fun(t, x_prev + h * k3, self.get_u(u, t0 + h), p, a)[:, self.ode_idx]
         return x_prev + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
 
@@ -4,6 +4,7 @@ All the examples in muscle_driven_with_contact are merely to show some dynamics
 It is not really relevant and will be removed when unitary tests for the dynamics will be implemented
 """
 
+from functools import lru_cache
 import importlib.util
 from pathlib import Path
 import platform
@@ -23,12 +24,19 @@ from bioptim import (
     SolutionMerge,
 )
 
-# Load track_segment_on_rt
-spec = importlib.util.spec_from_file_location(
-    "data_to_track", str(Path(__file__).parent) + "/contact_forces_inequality_constraint_muscle.py"
-)
-data_to_track = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(data_to_track)
+
+@lru_cache(maxsize=1)
+def _load_data_to_track():
+    """
+    Load the contact_forces_inequality_constraint_muscle.py example lazily, so importing this module
+    (e.g. to reach prepare_ocp from the tests) does not execute the example it only tracks in main()
+    """
+    spec = importlib.util.spec_from_file_location(
+        "data_to_track", str(Path(__file__).parent) + "/contact_forces_inequality_constraint_muscle.py"
+    )
+    data_to_track = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(data_to_track)
+    return data_to_track
 
 
 def prepare_ocp(
@@ -99,7 +107,7 @@ def main():
     ns = 20
 
     # Generate data using another optimization that will be feedback in as tracking data
-    ocp_to_track = data_to_track.prepare_ocp(
+    ocp_to_track = _load_data_to_track().prepare_ocp(
         biorbd_model_path=model_path,
         phase_time=final_time,
         n_shooting=ns,
@@ -66,7 +66,8 @@ def time_dependent_dynamic(
 
     q = DynamicsFunctions.get(nlp.states["q"], states)
     qdot = DynamicsFunctions.get(nlp.states["qdot"], states)
-    tau = DynamicsFunctions.get(nlp.controls["tau"], controls) * (sin(time) * time.ones(nlp.model.nb_tau) * 10)
+    # The scalar factor broadcasts over tau, with a single sin node instead of an nb_tau ones-vector
+    tau = DynamicsFunctions.get(nlp.controls["tau"], controls) * (sin(time) * 10)
 
     # You can directly call biorbd function (as for ddq) or call bioptim accessor (as for dq)
     dq = DynamicsFunctions.compute_qdot(nlp, q, qdot)
@@ -6,6 +6,7 @@ it is supposed to balance the pendulum. It is designed to show how to track mark
 Note that the final node is not tracked.
 """
 
+from functools import lru_cache
 from typing import Callable
 import importlib.util
 from pathlib import Path
@@ -32,11 +33,21 @@ from bioptim import (
     SolutionMerge,
 )
 
-# Load track_segment_on_rt
 EXAMPLES_FOLDER = Path(__file__).parent / ".."
-spec = importlib.util.spec_from_file_location("data_to_track", str(EXAMPLES_FOLDER) + "/getting_started/pendulum.py")
-data_to_track = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(data_to_track)
+
+
+@lru_cache(maxsize=1)
+def _load_data_to_track():
+    """
+    Load the getting_started/pendulum.py example lazily, so importing this module (e.g. to reach
+    prepare_ocp from the tests) does not execute the example it only tracks in main()
+    """
+    spec = importlib.util.spec_from_file_location(
+        "data_to_track", str(EXAMPLES_FOLDER / "getting_started" / "pendulum.py")
+    )
+    data_to_track = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(data_to_track)
+    return data_to_track
 
 
 def get_markers_pos(x: DM | np.ndarray, idx_marker: int, fun: Callable, n_q: int) -> DM | np.ndarray:
@@ -154,12 +165,12 @@ def main():
     torque from the solution and uses them to track. It then creates and solves this ocp and show the results
     """
 
-    biorbd_path = str(EXAMPLES_FOLDER) + "/getting_started/models/pendulum.bioMod"
+    biorbd_path = str(EXAMPLES_FOLDER / "getting_started" / "models" / "pendulum.bioMod")
     bio_model = BiorbdModel(biorbd_path)
     final_time = 1
     n_shooting = 20
 
-    ocp_to_track = data_to_track.prepare_ocp(
+    ocp_to_track = _load_data_to_track().prepare_ocp(
         biorbd_model_path=biorbd_path, final_time=final_time, n_shooting=n_shooting
     )
     sol = ocp_to_track.solve()
@@ -686,7 +686,7 @@ class MultinodePenaltyFunctions(PenaltyFunctionAbstract):
             if states_mapping is None:
                 states_mapping = []
                 for controller in controllers:
-                    states_mapping.append(BiMapping(range(controller.states.shape), range(controller.states.shape)))
+                    states_mapping.append(BiMapping.identity(controller.states.shape))
             else:
                 if not isinstance(states_mapping, (list, tuple)) and len(controllers) == 2:
                     states_mapping = [states_mapping]
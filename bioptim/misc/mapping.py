@@ -1,5 +1,7 @@
+from functools import lru_cache
+
 import numpy as np
-from casadi import MX, SX, DM
+from casadi import MX, SX, DM, vertcat
 
 from .options import OptionDict, OptionGeneric
 from .enums import Node
@@ -54,7 +56,43 @@ class Mapping(OptionGeneric):
             for i in oppose:
                 self.oppose[i] = -1
 
-    def map(self, obj: tuple | list | np.ndarray | MX | SX | DM) -> np.ndarray | MX | SX | DM:
+        # The sign partition of the mapping never changes, so it is computed here once, with
+        # vectorized masks instead of a per-element Python scan
+        indices = np.array([0 if v is None else v for v in self.map_idx], dtype=np.int64)
+        kept_mask = np.array([v is not None for v in self.map_idx], dtype=bool)
+        oppose_signs = np.array(self.oppose, dtype=np.int64)
+
+        # The ndarray path does a single signed gather: destination rows, source rows (kept raw, a
+        # negative map_idx entry indexes from the end as before) and the sign of each kept row
+        self._dst = np.nonzero(kept_mask)[0]
+        self._src = indices[kept_mask]
+        self._signs = oppose_signs[kept_mask].astype(np.float64)[:, np.newaxis]
+        self._has_oppose = bool((oppose_signs < 0).any())
+
+        # When the kept rows form one unit-stride run of uniform sign, the gather collapses to a
+        # plain block copy between slices
+        self._run = None
+        if (
+            self._dst.size
+            and np.all(np.diff(self._dst) == 1)
+            and np.all(np.diff(self._src) == 1)
+            and np.all(self._src >= 0)
+            and np.all(self._signs == self._signs[0, 0])
+        ):
+            self._run = (
+                slice(int(self._dst[0]), int(self._dst[-1]) + 1),
+                slice(int(self._src[0]), int(self._src[-1]) + 1),
+                self._signs[0, 0] > 0,
+            )
+
+        # An identity mapping (the BiMapping default) can skip the gather entirely in map()
+        self._is_identity = all(o == 1 for o in self.oppose) and list(self.map_idx) == list(range(len(self.map_idx)))
+        # When no row is dropped, the two gathers cover every output row and zeroing is wasted
+        self._needs_zero = any(v is None for v in self.map_idx)
+
+    def map(
+        self, obj: tuple | list | np.ndarray | MX | SX | DM, out: np.ndarray = None, dtype: np.dtype = None
+    ) -> np.ndarray | MX | SX | DM:
         """
         Apply the mapping to an matrix object. The rows are mapped while the columns are preserved as is
 
@@ -62,40 +100,67 @@ class Mapping(OptionGeneric):
         ----------
         obj: tuple | list | np.ndarray | MX | SX | DM
             The matrix to map
+        out: np.ndarray
+            An optional preallocated (len(self), n_columns) buffer to write the result into, so
+            repeated ndarray mappings reuse the same memory. Ignored on the symbolic path
+        dtype: np.dtype
+            An optional dtype for the allocated ndarray output (e.g. np.float32 for
+            post-processing paths that do not feed back into the optimization). Defaults to
+            float64; ignored when out is provided or on the symbolic path
 
         Returns
         -------
         The list mapped
         """
-        # Declare a zero filled object
         if isinstance(obj, (tuple, list)):
-            obj = np.array(obj)
+            # asarray reuses the buffer when possible; the float dtype keeps the output type
+            # identical whether the values land in a fresh buffer or go through the fast paths
+            obj = np.asarray(obj, dtype=np.float64)
 
         if isinstance(obj, np.ndarray):
             if len(obj.shape) == 1:
                 obj = obj[:, np.newaxis]
-            mapped_obj = np.zeros((len(self.map_idx), obj.shape[1]))
-        elif isinstance(obj, (MX, SX, DM)):
-            mapped_obj = type(obj).zeros(len(self.map_idx), obj.shape[1])
-        else:
-            raise RuntimeError("map must be applied on np.ndarray, MX or SX")
-
-        # Fill the positive values
-        index_plus_in_origin = []
-        index_plus_in_new = []
-        index_minus_in_origin = []
-        index_minus_in_new = []
-        for i, v in enumerate(self.map_idx):
-            if v is not None and self.oppose[i] > 0:
-                index_plus_in_origin.append(v)
-                index_plus_in_new.append(i)
-            elif v is not None and self.oppose[i] < 0:
-                index_minus_in_origin.append(v)
-                index_minus_in_new.append(i)
-        mapped_obj[index_plus_in_new, :] = obj[index_plus_in_origin, :]  # Fill the non zeros values
-        mapped_obj[index_minus_in_new, :] = -obj[index_minus_in_origin, :]  # Fill the non zeros values
-
-        return mapped_obj
+            if self._is_identity and obj.shape[0] == len(self.map_idx):
+                # Single-pass copy instead of a zero fill followed by a gather
+                if out is None:
+                    return obj.copy() if dtype is None else obj.astype(dtype)
+                np.copyto(out, obj)
+                return out
+            if out is None:
+                # Zeroing is only needed for the rows no gather will write
+                allocate = np.zeros if self._needs_zero else np.empty
+                mapped_obj = allocate((len(self.map_idx), obj.shape[1]), dtype=np.float64 if dtype is None else dtype)
+            else:
+                mapped_obj = out
+                if self._needs_zero:
+                    mapped_obj.fill(0)
+            if self._run is not None:
+                # Contiguous rows of uniform sign move as one block copy instead of a gather
+                dst_slice, src_slice, is_positive = self._run
+                mapped_obj[dst_slice, :] = obj[src_slice, :] if is_positive else -obj[src_slice, :]
+                return mapped_obj
+            # Fill the non zeros values in a single gather; the sign multiply is skipped entirely
+            # for mappings without opposed rows. np.take goes straight to the C gather without the
+            # __getitem__ dispatch; the default mode is kept since it is what preserves the
+            # index-from-the-end meaning of negative entries
+            gathered = np.take(obj, self._src, axis=0)
+            mapped_obj[self._dst, :] = gathered * self._signs if self._has_oppose else gathered
+            return mapped_obj
+
+        if isinstance(obj, (MX, SX, DM)):
+            if self._is_identity and obj.shape[0] == len(self.map_idx):
+                # A full slice hands back the same expression under a fresh handle, with no
+                # zero matrix and no assignment nodes added to the graph
+                return obj[:, :]
+            # Stacking the selected rows keeps the graph to plain selections and negations,
+            # instead of a dense zero matrix followed by two assignment nodes
+            rows = [
+                type(obj).zeros(1, obj.shape[1]) if v is None else (-obj[v, :] if self.oppose[i] < 0 else obj[v, :])
+                for i, v in enumerate(self.map_idx)
+            ]
+            return vertcat(*rows) if rows else type(obj).zeros(0, obj.shape[1])
+
+        raise RuntimeError("map must be applied on np.ndarray, MX or SX")
 
     def __len__(self) -> int:
         """
@@ -109,6 +174,26 @@ class Mapping(OptionGeneric):
         return len(self.map_idx)
 
 
+@lru_cache(maxsize=None)
+def _cached_mapping(map_idx: tuple, oppose: int | tuple | None) -> Mapping:
+    """
+    Memoize the index-list to Mapping coercion, so declaring the same mapping for every phase
+    pays the partition precomputation of Mapping.__init__ only once
+
+    Parameters
+    ----------
+    map_idx: tuple
+        The index tuple that links to the other set
+    oppose: int | tuple | None
+        Index to multiply by -1
+
+    Returns
+    -------
+    The (shared) Mapping for this index set
+    """
+    return Mapping(list(map_idx), list(oppose) if isinstance(oppose, tuple) else oppose)
+
+
 class BiMapping(OptionGeneric):
     """
     Mapping of two index sets between each other
@@ -147,9 +232,9 @@ class BiMapping(OptionGeneric):
         self.oppose_to_first = oppose_to_first
 
         if isinstance(to_second, (list, tuple, range)):
-            to_second = Mapping(map_idx=to_second, oppose=oppose_to_second)
+            to_second = BiMapping._to_mapping(to_second, oppose_to_second)
         if isinstance(to_first, (list, tuple, range)):
-            to_first = Mapping(map_idx=to_first, oppose=oppose_to_first)
+            to_first = BiMapping._to_mapping(to_first, oppose_to_first)
 
         if not isinstance(to_second, Mapping):
             raise RuntimeError("to_second must be a Mapping class")
@@ -159,6 +244,44 @@ class BiMapping(OptionGeneric):
         self.to_second = to_second
         self.to_first = to_first
 
+    @staticmethod
+    def _to_mapping(map_idx: list | tuple | range, oppose) -> Mapping:
+        """
+        Coerce an index collection into a Mapping, through the memoized constructor when the
+        inputs are hashable
+
+        Parameters
+        ----------
+        map_idx: list | tuple | range
+            The index collection that links to the other set
+        oppose: int | list | tuple | range | np.ndarray | None
+            Index to multiply by -1
+
+        Returns
+        -------
+        The Mapping for this index set
+        """
+        try:
+            return _cached_mapping(tuple(map_idx), tuple(oppose) if isinstance(oppose, (list, range)) else oppose)
+        except TypeError:
+            return Mapping(map_idx=map_idx, oppose=oppose)
+
+    @staticmethod
+    def identity(n: int) -> "BiMapping":
+        """
+        Create the identity mapping of n elements
+
+        Parameters
+        ----------
+        n: int
+            The number of elements to map on themselves
+
+        Returns
+        -------
+        The identity BiMapping, backed by ranges so no index list is materialized
+        """
+        return BiMapping(range(n), range(n))
+
 
 class BiMappingList(OptionDict):
     def add(
@@ -1,4 +1,5 @@
 from typing import Callable, Any
+from functools import cached_property
 
 import biorbd_casadi as biorbd
 from biorbd_casadi import (
@@ -56,38 +57,38 @@ class BiorbdModel:
         self.model.setGravity(new_gravity)
         return
 
-    @property
+    @cached_property
     def nb_tau(self) -> int:
         return self.model.nbGeneralizedTorque()
 
-    @property
+    @cached_property
     def nb_segments(self) -> int:
         return self.model.nbSegment()
 
     def segment_index(self, name) -> int:
         return biorbd.segment_index(self.model, name)
 
-    @property
+    @cached_property
     def nb_quaternions(self) -> int:
         return self.model.nbQuat()
 
-    @property
+    @cached_property
     def nb_dof(self) -> int:
         return self.model.nbDof()
 
-    @property
+    @cached_property
     def nb_q(self) -> int:
         return self.model.nbQ()
 
-    @property
+    @cached_property
     def nb_qdot(self) -> int:
         return self.model.nbQdot()
 
-    @property
+    @cached_property
     def nb_qddot(self) -> int:
         return self.model.nbQddot()
 
-    @property
+    @cached_property
     def nb_root(self) -> int:
         return self.model.nbRoot()
 
@@ -153,30 +154,30 @@ class BiorbdModel:
         qdot_biorbd = GeneralizedVelocity(qdot)
         return self.model.segmentAngularVelocity(q_biorbd, qdot_biorbd, idx, True).to_mx()
 
-    @property
+    @cached_property
     def name_dof(self) -> tuple[str, ...]:
         return tuple(s.to_string() for s in self.model.nameDof())
 
-    @property
+    @cached_property
     def contact_names(self) -> tuple[str, ...]:
         return tuple(s.to_string() for s in self.model.contactNames())
 
-    @property
+    @cached_property
     def nb_soft_contacts(self) -> int:
         return self.model.nbSoftContacts()
 
-    @property
+    @cached_property
     def soft_contact_names(self) -> tuple[str, ...]:
         return self.model.softContactNames()
 
     def soft_contact(self, soft_contact_index, *args):
         return self.model.softContact(soft_contact_index, *args)
 
-    @property
+    @cached_property
     def muscle_names(self) -> tuple[str, ...]:
         return tuple(s.to_string() for s in self.model.muscleNames())
 
-    @property
+    @cached_property
     def nb_muscles(self) -> int:
         return self.model.nbMuscles()
 
@@ -309,7 +310,7 @@ class BiorbdModel:
     def markers(self, q) -> list[MX]:
         return [m.to_mx() for m in self.model.markers(GeneralizedCoordinates(q))]
 
-    @property
+    @cached_property
     def nb_markers(self) -> int:
         return self.model.nbMarkers()
 
@@ -323,7 +324,7 @@ class BiorbdModel:
             marker.applyRT(global_homogeneous_matrix.transpose())
         return marker.to_mx()
 
-    @property
+    @cached_property
     def nb_rigid_contacts(self) -> int:
         """
         Returns the number of rigid contacts.
@@ -334,7 +335,7 @@ class BiorbdModel:
         """
         return self.model.nbRigidContacts()
 
-    @property
+    @cached_property
     def nb_contacts(self) -> int:
         """
         Returns the number of contact index.
@@ -424,7 +425,7 @@ class BiorbdModel:
     def markers_jacobian(self, q) -> list[MX]:
         return [m.to_mx() for m in self.model.markersJacobian(GeneralizedCoordinates(q))]
 
-    @property
+    @cached_property
     def marker_names(self) -> tuple[str, ...]:
         return tuple([s.to_string() for s in self.model.markerNames()])
 
@@ -442,12 +443,21 @@ class BiorbdModel:
 
         return soft_contact_forces
 
+    @cached_property
+    def _rigid_contact_parent_names(self) -> tuple[str, ...]:
+        return tuple(
+            self.model.segment(self.model.getBodyRbdlIdToBiorbdId(self.model.rigidContact(i).parentId()))
+            .name()
+            .to_string()
+            for i in range(self.nb_rigid_contacts)
+        )
+
     def reshape_fext_to_fcontact(self, fext: MX) -> list:
         count = 0
         f_contact_vec = []
         for i in range(self.nb_rigid_contacts):
             contact = self.model.rigidContact(i)
-            parent_name = self.model.segment(self.model.getBodyRbdlIdToBiorbdId(contact.parentId())).name().to_string()
+            parent_name = self._rigid_contact_parent_names[i]
 
             tp = MX.zeros(3)
             used_axes = [i for i, val in enumerate(contact.axes()) if val]
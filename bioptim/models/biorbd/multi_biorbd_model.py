@@ -1,4 +1,5 @@
 from typing import Callable, Any
+from functools import cached_property
 
 import biorbd_casadi as biorbd
 from biorbd_casadi import (
@@ -360,11 +361,11 @@ class MultiBiorbdModel:
             )
         return out
 
-    @property
+    @cached_property
     def name_dof(self) -> tuple[str, ...]:
         return tuple([dof for model in self.models for dof in model.name_dof])
 
-    @property
+    @cached_property
     def contact_names(self) -> tuple[str, ...]:
         return tuple([contact for model in self.models for contact in model.contact_names])
 
@@ -372,7 +373,7 @@ class MultiBiorbdModel:
     def nb_soft_contacts(self) -> int:
         return sum(model.nb_soft_contacts for model in self.models)
 
-    @property
+    @cached_property
     def soft_contact_names(self) -> tuple[str, ...]:
         return tuple([contact for model in self.models for contact in model.soft_contact_names])
 
@@ -386,7 +387,7 @@ class MultiBiorbdModel:
             current_number_of_soft_contacts += model.nb_soft_contacts
         return out
 
-    @property
+    @cached_property
     def muscle_names(self) -> tuple[str, ...]:
         return tuple([muscle for model in self.models for muscle in model.muscle_names])
 
@@ -660,7 +661,7 @@ class MultiBiorbdModel:
     def nb_dof(self) -> int:
         return sum(model.nb_dof for model in self.models)
 
-    @property
+    @cached_property
     def marker_names(self) -> tuple[str, ...]:
         return tuple([name for model in self.models for name in model.marker_names])
 
@@ -30,7 +30,7 @@ def _q_mapping(model, mapping: BiMapping = None) -> dict:
                 "It is not possible to provide a qdot_mapping but not a q_mapping if the model have quaternion"
             )
     if "q" not in mapping:
-        mapping["q"] = BiMapping(range(model.nb_q), range(model.nb_q))
+        mapping["q"] = BiMapping.identity(model.nb_q)
     return mapping
 
 
@@ -42,7 +42,7 @@ def _qdot_mapping(model, mapping: BiMapping = None) -> dict:
     if mapping is None:
         mapping = {}
     if "qdot" not in mapping:
-        mapping["qdot"] = BiMapping(range(model.nb_qdot), range(model.nb_qdot))
+        mapping["qdot"] = BiMapping.identity(model.nb_qdot)
 
     return mapping
 
@@ -55,7 +55,7 @@ def _qddot_mapping(model, mapping: BiMapping = None) -> dict:
     if mapping is None:
         mapping = {}
     if "qddot" not in mapping:
-        mapping["qddot"] = BiMapping(range(model.nb_qddot), range(model.nb_qddot))
+        mapping["qddot"] = BiMapping.identity(model.nb_qddot)
 
     return mapping
 
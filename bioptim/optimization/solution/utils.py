@@ -1,6 +1,42 @@
 import numpy as np
 
 
+def _concatenate_leaf(arrays: list[np.ndarray], drop_last: bool) -> np.ndarray:
+    """
+    Concatenate arrays along their last axis, dropping the last column (or last element for 1d
+    arrays) of every array but the final one when drop_last is True
+
+    Parameters
+    ----------
+    arrays: list[np.ndarray]
+        The arrays to concatenate, all of the same dimensionality
+    drop_last: bool
+        If the arrival value of each array but the last one should be discarded
+
+    Returns
+    -------
+    The concatenated array
+    """
+    # The dimensionality is homogeneous across a leaf, so it is checked once instead of per array
+    is_2d = len(arrays[0].shape) == 2
+    if drop_last:
+        views = [(y[:, :-1] if is_2d else y[:-1]) for y in arrays[:-1]] + [arrays[-1]]
+    else:
+        # Nothing to trim, the arrays are concatenated as is
+        views = arrays
+    if not is_2d:
+        return np.concatenate(views, axis=-1)
+
+    # Allocate the output once and copy each block in place, instead of letting hstack build an
+    # intermediate sequence and a second buffer
+    out = np.empty((views[0].shape[0], sum(v.shape[1] for v in views)), dtype=np.result_type(*views))
+    offset = 0
+    for v in views:
+        out[:, offset : offset + v.shape[1]] = v
+        offset += v.shape[1]
+    return out
+
+
 def concatenate_optimization_variables_dict(
     variable: list[dict[np.ndarray]], continuous: bool = True
 ) -> list[dict[np.ndarray]]:
@@ -22,15 +58,13 @@ def concatenate_optimization_variables_dict(
     """
     if isinstance(variable, list):
         if isinstance(variable[0], dict):
-            variable_dict = dict()
-            for key in variable[0].keys():
-                variable_dict[key] = [v_i[key] for v_i in variable]
-                final_tuple = [
-                    y[:, :-1] if i < (len(variable_dict[key]) - 1) and continuous else y
-                    for i, y in enumerate(variable_dict[key])
-                ]
-                variable_dict[key] = np.hstack(final_tuple)
-            return [variable_dict]
+            # Traverse the phases once, accumulating per key, instead of re-iterating the phase
+            # list for every key
+            per_key = {key: [] for key in variable[0]}
+            for v_i in variable:
+                for key, value in v_i.items():
+                    per_key[key].append(value)
+            return [{key: _concatenate_leaf(arrays, continuous) for key, arrays in per_key.items()}]
     else:
         raise ValueError("the input must be a list")
 
@@ -62,18 +96,9 @@ def concatenate_optimization_variables(
     z_concatenated : np.ndarray or dict
         array of the decision variables of the phases of the system concatenated
     """
-    if len(variable[0].shape):
-        if isinstance(variable[0][0], np.ndarray):
-            z_final = [concatenate_optimization_variables(zi, continuous_interval) for zi in variable]
-
-            return concatenate_optimization_variables(z_final, continuous_phase) if merge_phases else z_final
-
-        else:
-            final_tuple = []
-            for i, y in enumerate(variable):
-                if i < (len(variable) - 1) and continuous_phase:
-                    final_tuple.append(y[:, :-1] if len(y.shape) == 2 else y[:-1])
-                else:
-                    final_tuple.append(y)
+    if isinstance(variable[0][0], np.ndarray):
+        # Phases of intervals: merge the intervals of each phase, then the phases themselves
+        z_final = [_concatenate_leaf(list(zi), continuous_interval) for zi in variable]
+        return _concatenate_leaf(z_final, continuous_phase) if merge_phases else z_final
 
-        return np.hstack(final_tuple)
+    return _concatenate_leaf(variable, continuous_phase)
@@ -2161,3 +2161,66 @@ def test_with_contact_error(dynamics_fcn, phase_dynamics):
             objective_functions=objective_functions,
             ode_solver=OdeSolver.RK4(),
         )
+
+
+def test_dynamics_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("BIOPTIM_CACHE_DIR", str(tmp_path))
+
+    def configure():
+        nlp = NonLinearProgram(phase_dynamics=PhaseDynamics.SHARED_DURING_THE_PHASE)
+        nlp.model = BiorbdModel(
+            TestUtils.bioptim_folder() + "/examples/getting_started/models/2segments_4dof_2contacts.bioMod"
+        )
+        nlp.ns = 5
+        nlp.cx = MX
+        nlp.time_mx = MX.sym("time", 1, 1)
+        nlp.dt_mx = MX.sym("dt", 1, 1)
+        nlp.initialize(MX)
+
+        nlp.x_bounds = np.zeros((nlp.model.nb_q * 3, 1))
+        nlp.u_bounds = np.zeros((nlp.model.nb_q, 1))
+        nlp.x_scaling = VariableScalingList()
+        nlp.xdot_scaling = VariableScalingList()
+        nlp.u_scaling = VariableScalingList()
+        nlp.s_scaling = VariableScalingList()
+
+        ocp = OptimalControlProgram(nlp)
+        nlp.control_type = ControlType.CONSTANT
+        NonLinearProgram.add(
+            ocp,
+            "dynamics_type",
+            Dynamics(
+                DynamicsFcn.TORQUE_DRIVEN,
+                expand_dynamics=True,
+                phase_dynamics=PhaseDynamics.SHARED_DURING_THE_PHASE,
+            ),
+            False,
+        )
+        phase_index = [i for i in range(ocp.n_phases)]
+        NonLinearProgram.add(ocp, "phase_idx", phase_index, False)
+        use_states_from_phase_idx = [i for i in range(ocp.n_phases)]
+        use_states_dot_from_phase_idx = [i for i in range(ocp.n_phases)]
+        use_controls_from_phase_idx = [i for i in range(ocp.n_phases)]
+        NonLinearProgram.add(ocp, "use_states_from_phase_idx", use_states_from_phase_idx, False)
+        NonLinearProgram.add(ocp, "use_states_dot_from_phase_idx", use_states_dot_from_phase_idx, False)
+        NonLinearProgram.add(ocp, "use_controls_from_phase_idx", use_controls_from_phase_idx, False)
+
+        ConfigureProblem.initialize(ocp, nlp)
+        return nlp
+
+    # The first configuration builds the dynamics and writes it to the cache directory
+    nlp = configure()
+    assert len(list(tmp_path.glob("*.casadi"))) == 1
+
+    np.random.seed(42)
+    states = np.random.rand(nlp.states.shape, nlp.ns)
+    controls = np.random.rand(nlp.controls.shape, nlp.ns)
+    params = np.random.rand(nlp.parameters.shape, nlp.ns)
+    algebraic_states = np.random.rand(nlp.algebraic_states.shape, nlp.ns)
+    time = np.random.rand(2)
+    x_out = np.array(nlp.dynamics_func[0](time, states, controls, params, algebraic_states))
+
+    # The second configuration reloads the Function from disk and must evaluate identically
+    nlp_cached = configure()
+    x_out_cached = np.array(nlp_cached.dynamics_func[0](time, states, controls, params, algebraic_states))
+    np.testing.assert_almost_equal(x_out_cached, x_out)
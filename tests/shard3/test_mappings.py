@@ -15,6 +15,36 @@ def test_mapping():
     np.testing.assert_almost_equal(Mapping([None, 0], oppose=1).map(obj_to_map), [[0, 0, 0], [0, -1, -2]])
 
 
+def test_mapping_out_and_dtype():
+    obj_to_map = np.array([[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11]])
+    mapping = Mapping([None, 2, 1], oppose=[1, 2])
+
+    # The preallocated buffer is filled and returned as is, and can be reused across calls
+    out = np.full((3, 3), 42.0)
+    mapped = mapping.map(obj_to_map, out=out)
+    assert mapped is out
+    np.testing.assert_almost_equal(out, [[0, 0, 0], [-6, -7, -8], [-3, -4, -5]])
+    mapping.map(obj_to_map + 1, out=out)
+    np.testing.assert_almost_equal(out, [[0, 0, 0], [-7, -8, -9], [-4, -5, -6]])
+
+    # The dtype of the allocated output can be lowered, the values are unchanged
+    mapped_f32 = mapping.map(obj_to_map, dtype=np.float32)
+    assert mapped_f32.dtype == np.float32
+    np.testing.assert_almost_equal(mapped_f32, [[0, 0, 0], [-6, -7, -8], [-3, -4, -5]])
+
+    # The identity fast path returns a copy preserving the input dtype, honors dtype and out
+    identity = Mapping([0, 1, 2, 3])
+    obj_f32 = obj_to_map.astype(np.float32)
+    mapped_identity = identity.map(obj_f32)
+    assert mapped_identity is not obj_f32
+    assert mapped_identity.dtype == np.float32
+    np.testing.assert_almost_equal(mapped_identity, obj_to_map)
+    assert identity.map(obj_f32, dtype=np.float64).dtype == np.float64
+    out_identity = np.empty((4, 3))
+    assert identity.map(obj_to_map, out=out_identity) is out_identity
+    np.testing.assert_almost_equal(out_identity, obj_to_map)
+
+
 def test_bidirectional_mapping():
     mapping = BiMapping([0, 1, 2], [3, 4, 5])
 
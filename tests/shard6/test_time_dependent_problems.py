@@ -64,7 +64,8 @@ def time_dynamic(
 
     q = DynamicsFunctions.get(nlp.states["q"], states)
     qdot = DynamicsFunctions.get(nlp.states["qdot"], states)
-    tau = DynamicsFunctions.get(nlp.controls["tau"], controls) * (sin(time) * time.ones(nlp.model.nb_tau) * 10)
+    # The scalar factor broadcasts over tau, with a single sin node instead of an nb_tau ones-vector
+    tau = DynamicsFunctions.get(nlp.controls["tau"], controls) * (sin(time) * 10)
 
     # You can directly call biorbd function (as for ddq) or call bioptim accessor (as for dq)
     dq = DynamicsFunctions.compute_qdot(nlp, q, qdot)
@@ -100,7 +101,7 @@ def prepare_ocp(
     control_type: ControlType,
     minimize_time: bool,
     use_sx: bool,
-    phase_dynamics: PhaseDynamics = PhaseDynamics.ONE_PER_NODE,
+    phase_dynamics: PhaseDynamics = PhaseDynamics.SHARED_DURING_THE_PHASE,
 ) -> OptimalControlProgram:
     """
     Prepare the ocp
@@ -130,16 +131,15 @@ def prepare_ocp(
     The OptimalControlProgram ready to be solved
     """
 
-    bio_model = (
-        [BiorbdModel(biorbd_model_path)]
-        if n_phase == 1
-        else [BiorbdModel(biorbd_model_path), BiorbdModel(biorbd_model_path)]
-    )
+    # The phases are identical, so the .bioMod is parsed once and the handle shared between them
+    bio_model = [BiorbdModel(biorbd_model_path)] * n_phase
     final_time = [1] * n_phase
     n_shooting = [50 if isinstance(ode_solver, OdeSolver.IRK) else 30] * n_phase
 
-    # Add objective functions
+    # Add objective functions and dynamics, in a single pass over the phases
     objective_functions = ObjectiveList()
+    dynamics = DynamicsList()
+    expand = not isinstance(ode_solver, OdeSolver.IRK)
     for i in range(len(bio_model)):
         objective_functions.add(ObjectiveFcn.Lagrange.MINIMIZE_CONTROL, key="tau", weight=100, phase=i, quadratic=True)
         if minimize_time:
@@ -147,11 +147,6 @@ def prepare_ocp(
             objective_functions.add(
                 ObjectiveFcn.Mayer.MINIMIZE_TIME, target=target, weight=20000, phase=i, quadratic=True
             )
-
-    # Dynamics
-    dynamics = DynamicsList()
-    expand = not isinstance(ode_solver, OdeSolver.IRK)
-    for i in range(len(bio_model)):
         dynamics.add(
             custom_configure,
             dynamic_function=time_dynamic,
@@ -169,21 +164,25 @@ def prepare_ocp(
         x_bounds["qdot"] = bio_model[0].bounds_from_ranges("qdot")
         x_bounds["qdot"][:, [0, -1]] = 0
     else:
+        # The phases share the same model, so the ranges are always read from the first one. A
+        # fresh Bounds is still built per phase since BoundsList stores the object as is and the
+        # two phases are modified differently below
         x_bounds.add("q", bounds=bio_model[0].bounds_from_ranges("q"), phase=0)
-        x_bounds.add("q", bounds=bio_model[1].bounds_from_ranges("q"), phase=1)
+        x_bounds.add("q", bounds=bio_model[0].bounds_from_ranges("q"), phase=1)
         x_bounds[0]["q"][:, [0, -1]] = 0
         x_bounds[0]["q"][-1, -1] = 3.14
         x_bounds[1]["q"][:, -1] = 0
 
         x_bounds.add("qdot", bounds=bio_model[0].bounds_from_ranges("qdot"), phase=0)
-        x_bounds.add("qdot", bounds=bio_model[1].bounds_from_ranges("qdot"), phase=1)
+        x_bounds.add("qdot", bounds=bio_model[0].bounds_from_ranges("qdot"), phase=1)
         x_bounds[0]["qdot"][:, [0, -1]] = 0
         x_bounds[1]["qdot"][:, -1] = 0
 
     # Define control path constraint
     n_tau = bio_model[0].nb_tau
     u_bounds = BoundsList()
-    u_bounds_tau = [[-100] * n_tau, [100] * n_tau]  # Limit the strength of the pendulum to (-100 to 100)...
+    # Limit the strength of the pendulum to (-100 to 100)...
+    u_bounds_tau = [np.full(n_tau, -100.0), np.full(n_tau, 100.0)]
     u_bounds_tau[0][1] = 0  # ...but remove the capability to actively rotate
     u_bounds_tau[1][1] = 0  # ...but remove the capability to actively rotate
     for i in range(len(bio_model)):